@@ -13,27 +13,90 @@ Usage:
 
 import os
 import sys
-import json
 import time
+import queue
+import atexit
 import shutil
 import argparse
 import platform
+import threading
 import subprocess
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, fields
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 import logging
+import logging.handlers
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('rubix_manager.log'),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
 logger = logging.getLogger(__name__)
+_log_listener = None
+
+def _setup_logging():
+    """Configure logging on first use rather than at import.
+
+    The file and console handlers sit behind a queue so logger calls on
+    hot startup paths never block on synchronous writes. Deferring this
+    keeps --help and bad invocations from opening the log file and
+    starting the listener thread. Idempotent.
+    """
+    global _log_listener
+    if _log_listener is not None:
+        return
+    log_queue = queue.Queue(-1)
+    log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+    file_handler = logging.FileHandler('rubix_manager.log')
+    file_handler.setFormatter(log_formatter)
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(log_formatter)
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    # Leave formatting to the listener's handlers; the queue just carries the message
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+    logging.basicConfig(
+        level=logging.INFO,
+        handlers=[queue_handler]
+    )
+    _log_listener = logging.handlers.QueueListener(log_queue, file_handler, stream_handler)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+
+# Platform facts never change at runtime; compute them once at import instead
+# of branching on platform.system() in every per-node helper
+IS_WINDOWS = platform.system() == "Windows"
+BUILD_DIR_NAME = {"windows": "windows", "linux": "linux", "darwin": "mac"}.get(
+    platform.system().lower(), "build")
+RUBIX_BIN = "rubixgoplatform.exe" if IS_WINDOWS else "rubixgoplatform"
+IPFS_BIN = "ipfs.exe" if IS_WINDOWS else "ipfs"
+
+def _install_file(src, dst, executable: bool = False):
+    """Place a build artifact in a node directory, hard-linking when possible.
+
+    The rubix and ipfs binaries run to tens or hundreds of MB each; a hard
+    link moves no bytes when source and destination share a filesystem.
+    Falls back to a regular copy otherwise (e.g. cross-device link error).
+    """
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+    if executable and not IS_WINDOWS:
+        os.chmod(dst, 0o755)
+
+def wait_until(predicate, timeout: float, poll: float = 0.5, backoff: float = 1.5, cap: float = 5.0) -> bool:
+    """Poll a predicate with growing delay until it returns truthy or the timeout expires"""
+    deadline = time.time() + timeout
+    delay = poll
+    while True:
+        if predicate():
+            return True
+        remaining = deadline - time.time()
+        if remaining <= 0:
+            return False
+        time.sleep(min(delay, remaining))
+        delay = min(cap, delay * backoff)
 
 class RubixConfig:
     """Configuration class matching Go config structure"""
@@ -51,40 +114,47 @@ class RubixConfig:
         self.rubix_repo_url = "https://github.com/rubixchain/rubixgoplatform.git"
         self.rubix_branch = "main"
         self.ipfs_version = "v0.21.0"
+        # Durable metadata writes (fsync before rename); disable for dev
+        # runs where losing the last save on a crash is acceptable
+        self.metadata_fsync = True
         self.test_swarm_key_url = "https://raw.githubusercontent.com/rubixchain/rubixgoplatform/main/testswarm.key"
 
+@dataclass
 class NodeInfo:
-    """Node information class matching Go NodeInfo struct"""
-    
-    def __init__(self, node_id: str, server_port: int, grpc_port: int, 
-                 did: str = "", peer_id: str = "", is_quorum: bool = False, 
-                 status: str = "stopped"):
-        self.id = node_id
-        self.server_port = server_port
-        self.grpc_port = grpc_port
-        self.did = did
-        self.peer_id = peer_id
-        self.is_quorum = is_quorum
-        self.status = status
-        self.process = None
-
-    def to_dict(self):
-        """Convert to dictionary for JSON serialization"""
-        return {
-            "id": self.id,
-            "server_port": self.server_port,
-            "grpc_port": self.grpc_port,
-            "did": self.did,
-            "peer_id": self.peer_id,
-            "is_quorum": self.is_quorum,
-            "status": self.status
-        }
+    """Node information class matching Go NodeInfo struct.
+
+    Declared fields are the persisted ones; orjson serializes them
+    natively, so no to_dict() pass is needed when saving metadata.
+    The extra slots hold runtime-only state that never hits disk.
+    """
+
+    __slots__ = ("id", "server_port", "grpc_port", "did", "peer_id",
+                 "is_quorum", "status", "process", "base_url", "client")
+
+    id: str
+    server_port: int
+    grpc_port: int
+    did: str
+    peer_id: str
+    is_quorum: bool
+    status: str
+
+    def __post_init__(self):
+        self.process: Optional[subprocess.Popen] = None
+        # Runtime-only fields computed once instead of per phase
+        self.base_url = f"http://localhost:{self.server_port}"
+        self.client: Optional["RubixClient"] = None
+
+    @property
+    def did_display(self) -> str:
+        """Truncated DID for log lines"""
+        return self.did[:16] + "..." if len(self.did) > 16 else self.did
 
     @classmethod
     def from_dict(cls, data: dict):
         """Create NodeInfo from dictionary"""
         return cls(
-            node_id=data["id"],
+            id=data["id"],
             server_port=data["server_port"],
             grpc_port=data["grpc_port"],
             did=data.get("did", ""),
@@ -93,30 +163,68 @@ class NodeInfo:
             status=data.get("status", "stopped")
         )
 
+    @classmethod
+    def _from_persisted(cls, data: dict) -> "NodeInfo":
+        """Rebuild from metadata this process wrote: every field is present,
+        so skip the generated __init__ and assign slots directly."""
+        obj = cls.__new__(cls)
+        for name in _NODE_FIELDS:
+            setattr(obj, name, data[name])
+        obj.__post_init__()
+        return obj
+
+_NODE_FIELDS = tuple(f.name for f in fields(NodeInfo))
+
 class RubixClient:
     """HTTP client for communicating with Rubix nodes"""
-    
-    def __init__(self, base_url: str):
+
+    # Short-lived DID -> balance cache shared across instances; the Phase 5
+    # waiter and its retries look up the same DIDs within seconds
+    _balance_cache: Dict[Tuple[str, str], Tuple[float, float]] = {}
+    _balance_cache_lock = threading.Lock()
+    _balance_cache_ttl = 1.5  # seconds
+
+    # Retry-free session used only for readiness probes. The shared
+    # session's Retry policy backs off internally on connection-refused,
+    # stretching a single probe against a booting node to several seconds
+    # and defeating the adaptive poll loop below.
+    _probe_http = requests.Session()
+    _probe_http.mount("http://", HTTPAdapter(max_retries=0))
+
+    def __init__(self, base_url: str, session: Optional[requests.Session] = None):
         self.base_url = base_url
-        self.session = requests.Session()
+        self.session = session if session is not None else requests.Session()
         self.session.timeout = 30
 
+    def _post_json(self, path: str, payload) -> requests.Response:
+        """POST a payload encoded with orjson (faster than the stdlib encoder)"""
+        return self.session.post(
+            f"{self.base_url}{path}",
+            data=orjson.dumps(payload),
+            headers={"Content-Type": "application/json"},
+            timeout=(5, 30)
+        )
+
     def wait_for_node(self, timeout: int = 120) -> bool:
         """Wait for node to be ready"""
         logger.info(f"  Waiting for node at {self.base_url} to be ready (timeout: {timeout}s)...")
         
+        # Poll aggressively at first, then back off to avoid hammering a slow node
+        delay = 0.05
+        cap = 1.0
         start_time = time.time()
         while time.time() - start_time < timeout:
             try:
-                response = self.session.get(f"{self.base_url}/api/basic-info")
+                response = self._probe_http.get(f"{self.base_url}/api/basic-info", timeout=1)
                 if response.status_code == 200:
                     logger.info(f"  ✓ Node at {self.base_url} is ready")
                     return True
             except requests.exceptions.RequestException:
                 pass
-            
-            time.sleep(2)
-        
+
+            time.sleep(delay)
+            delay = min(cap, delay * 1.5)
+
         logger.error(f"  ✗ Node at {self.base_url} failed to start within {timeout}s")
         return False
 
@@ -125,12 +233,12 @@ class RubixClient:
         logger.info(f"  Creating DID for node at {self.base_url}...")
         
         payload = {"privPWD": password}
-        response = self.session.post(f"{self.base_url}/api/create-did", json=payload)
+        response = self._post_json("/api/create-did", payload)
         
         if response.status_code != 200:
             raise Exception(f"Failed to create DID: {response.status_code} - {response.text}")
         
-        data = response.json()
+        data = orjson.loads(response.content)
         if not data.get("status", False):
             raise Exception(f"Create DID failed: {data.get('message', 'Unknown error')}")
         
@@ -154,13 +262,13 @@ class RubixClient:
         logger.info(f"  Registering DID for node at {self.base_url}...")
         
         payload = {"did": did}
-        response = self.session.post(f"{self.base_url}/api/register-did", json=payload)
+        response = self._post_json("/api/register-did", payload)
         
         if response.status_code != 200:
             logger.error(f"  ✗ Failed to register DID: {response.status_code} - {response.text}")
             return False
         
-        data = response.json()
+        data = orjson.loads(response.content)
         if data.get("status", False) and data.get("message") == "Password needed":
             # Handle signature response
             result = data.get("result", {})
@@ -179,15 +287,28 @@ class RubixClient:
 
     def add_quorum(self, quorum_list: List[dict]) -> bool:
         """Add quorum list to the node"""
+        return self.add_quorum_raw(orjson.dumps(quorum_list))
+
+    def add_quorum_raw(self, body: bytes) -> bool:
+        """Add a pre-serialized quorum list to the node.
+
+        The same list goes to every node, so callers can serialize it once
+        and hand the bytes to each request instead of re-encoding per node.
+        """
         logger.info(f"  Adding quorum list to node at {self.base_url}...")
-        
-        response = self.session.post(f"{self.base_url}/api/add-quorum", json=quorum_list)
-        
+
+        response = self.session.post(
+            f"{self.base_url}/api/add-quorum",
+            data=body,
+            headers={"Content-Type": "application/json"},
+            timeout=(5, 30)
+        )
+
         if response.status_code != 200:
             logger.error(f"  ✗ Failed to add quorum: {response.status_code} - {response.text}")
             return False
         
-        data = response.json()
+        data = orjson.loads(response.content)
         if not data.get("status", False):
             logger.error(f"  ✗ Add quorum failed: {data.get('message', 'Unknown error')}")
             return False
@@ -205,13 +326,13 @@ class RubixClient:
             "priv_password": priv_password
         }
         
-        response = self.session.post(f"{self.base_url}/api/setup-quorum", json=payload)
+        response = self._post_json("/api/setup-quorum", payload)
         
         if response.status_code != 200:
             logger.error(f"  ✗ Failed to setup quorum: {response.status_code} - {response.text}")
             return False
         
-        data = response.json()
+        data = orjson.loads(response.content)
         if not data.get("status", False):
             logger.error(f"  ✗ Setup quorum failed: {data.get('message', 'Unknown error')}")
             return False
@@ -219,8 +340,16 @@ class RubixClient:
         logger.info(f"  ✓ Successfully setup quorum")
         return True
 
-    def generate_test_tokens(self, did: str, num_tokens: int, password: str) -> bool:
-        """Generate test tokens for the node"""
+    def generate_test_tokens(self, did: str, num_tokens: int, password: str,
+                             verify: bool = True) -> Tuple[bool, float]:
+        """Generate test tokens for the node.
+
+        Returns (submitted, balance): whether the generation request was
+        accepted, and the confirmed balance when verify is True (0.0 when
+        verification is skipped or the balance never went positive). Callers
+        should only re-trigger generation when submitted is False rather
+        than re-checking an already confirmed balance.
+        """
         logger.info(f"  Generating {num_tokens} test tokens for node at {self.base_url}...")
         
         payload = {
@@ -228,43 +357,64 @@ class RubixClient:
             "did": did
         }
         
-        response = self.session.post(f"{self.base_url}/api/generate-test-token", json=payload)
+        response = self._post_json("/api/generate-test-token", payload)
         
         if response.status_code != 200:
             logger.error(f"  ✗ Failed to generate tokens: {response.status_code} - {response.text}")
-            return False
-        
-        data = response.json()
+            return False, 0.0
+
+        data = orjson.loads(response.content)
         if data.get("status", False) and data.get("message") == "Password needed":
             # Handle signature response
             result = data.get("result", {})
             sig_id = result.get("id", "")
             mode = result.get("mode", 0)
-            
+
             if sig_id:
                 success = self._send_signature_response(sig_id, mode, password)
                 if success:
+                    # Token generation is about to change the balance
+                    self.invalidate_balance(did)
+                    if not verify:
+                        # Caller handles balance verification (e.g. shared waiter)
+                        return True, 0.0
                     # Wait and check balance
-                    return self._verify_token_generation(did)
-        
-        return False
+                    if self._verify_token_generation(did):
+                        return True, self.get_account_balance(did)
+                    return True, 0.0
+
+        return False, 0.0
 
     def get_account_balance(self, did: str) -> float:
-        """Get account balance for a DID"""
+        """Get account balance for a DID (cached briefly to collapse repeated lookups)"""
+        cache_key = (self.base_url, did)
+        now = time.monotonic()
+        with self._balance_cache_lock:
+            cached = self._balance_cache.get(cache_key)
+            if cached is not None and now - cached[0] < self._balance_cache_ttl:
+                return cached[1]
+
         response = self.session.get(f"{self.base_url}/api/get-account-info", params={"did": did})
-        
+
         if response.status_code != 200:
             raise Exception(f"Failed to get account info: {response.status_code}")
-        
-        data = response.json()
+
+        data = orjson.loads(response.content)
         if not data.get("status", False):
             raise Exception(f"Get account info failed: {data.get('message', 'Unknown error')}")
-        
+
         account_info = data.get("account_info", [])
-        if account_info:
-            return account_info[0].get("rbt_amount", 0.0)
-        
-        return 0.0
+        balance = account_info[0].get("rbt_amount", 0.0) if account_info else 0.0
+
+        with self._balance_cache_lock:
+            self._balance_cache[cache_key] = (time.monotonic(), balance)
+
+        return balance
+
+    def invalidate_balance(self, did: str):
+        """Drop the cached balance for a DID after an operation that changes it"""
+        with self._balance_cache_lock:
+            self._balance_cache.pop((self.base_url, did), None)
 
     def _send_signature_response(self, sig_id: str, mode: int, password: str) -> bool:
         """Send signature response with password"""
@@ -276,13 +426,13 @@ class RubixClient:
             "password": password
         }
         
-        response = self.session.post(f"{self.base_url}/api/signature-response", json=payload)
+        response = self._post_json("/api/signature-response", payload)
         
         if response.status_code != 200:
             logger.error(f"  ✗ Failed to send signature response: {response.status_code}")
             return False
         
-        data = response.json()
+        data = orjson.loads(response.content)
         if not data.get("status", False):
             logger.error(f"  ✗ Signature response failed: {data.get('message', 'Unknown error')}")
             return False
@@ -290,22 +440,27 @@ class RubixClient:
         logger.info(f"  ✓ Signature response sent successfully")
         return True
 
-    def _verify_token_generation(self, did: str, max_attempts: int = 10) -> bool:
+    def _verify_token_generation(self, did: str, timeout: float = 50.0) -> bool:
         """Verify tokens were generated by checking balance"""
         logger.info(f"  Waiting for async token generation...")
-        
-        for i in range(max_attempts):
-            time.sleep(5)
+
+        def _has_balance() -> bool:
             try:
                 balance = self.get_account_balance(did)
-                logger.info(f"  Check {i+1}: Current balance: {balance:.2f} RBT")
+                logger.info(f"  Current balance: {balance:.2f} RBT")
                 if balance > 0:
                     logger.info(f"  ✓ Tokens generated! Final balance: {balance:.2f} RBT")
                     return True
             except Exception as e:
-                logger.warning(f"  Check {i+1}: Failed to get balance: {e}")
-        
-        logger.warning(f"  ⚠ Token generation may have failed - balance still 0 after {max_attempts * 5}s")
+                logger.warning(f"  Failed to get balance: {e}")
+            return False
+
+        # Transient HTTP failures are retried by the session adapter; this
+        # loop only waits out the semantic condition (balance still 0)
+        if wait_until(_has_balance, timeout=timeout):
+            return True
+
+        logger.warning(f"  ⚠ Token generation may have failed - balance still 0 after {timeout:.0f}s")
         return False
 
 class RubixManager:
@@ -314,9 +469,44 @@ class RubixManager:
     def __init__(self, config: RubixConfig):
         self.config = config
         self.nodes: Dict[str, NodeInfo] = {}
+        self.executor: Optional[ThreadPoolExecutor] = None
+
+        # Single pooled session shared by every RubixClient so keep-alive
+        # connections survive across phases instead of re-handshaking per call
+        self.http = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=64,
+            pool_maxsize=64,
+            max_retries=Retry(
+                total=4,
+                backoff_factor=0.3,
+                backoff_jitter=0.3,
+                status_forcelist=[502, 503, 504],
+                allowed_methods=["GET", "POST"]
+            )
+        )
+        self.http.mount("http://", adapter)
+        self.http.mount("https://", adapter)
+
         self.data_dir = Path(config.data_dir)
+        # Resolve once; per-node code paths derive from these instead of
+        # re-running abspath/join for every node
+        self.abs_data_dir = self.data_dir.resolve()
         self.metadata_file = self.data_dir / "node_metadata.json"
+        self._metadata_lock = threading.Lock()
+        # Parsed metadata memoized against the file's (mtime_ns, size) so
+        # repeated loads within one process skip the read + parse
+        self._meta_cache: Optional[Tuple[Tuple[int, int], Dict]] = None
+        # Set instead of saving from per-node workers; phases flush once
+        self._dirty = False
+        self._processes: Dict[str, subprocess.Popen] = {}
+        self._nodes_dir = self.data_dir / "nodes"
+        self._abs_nodes_dir = self.abs_data_dir / "nodes"
         self.rubix_path = self.data_dir / "rubixgoplatform"
+        self.build_dir = self.abs_data_dir / "rubixgoplatform" / BUILD_DIR_NAME
+        self._src_rubix = self.build_dir / RUBIX_BIN
+        self._src_ipfs = self.build_dir / IPFS_BIN
+        self._src_swarm_key = self.build_dir / "testswarm.key"
         
         # Create data directory
         self.data_dir.mkdir(exist_ok=True)
@@ -349,42 +539,56 @@ class RubixManager:
             return False
         
         total_nodes = self.config.quorum_node_count + transaction_node_count
-        
+
+        # Shared worker pool for the per-node HTTP fan-out in each phase
+        self.executor = ThreadPoolExecutor(max_workers=min(32, total_nodes))
+
         # Phase 1: Start all nodes
         logger.info("\n================== PHASE 1: Starting Nodes ==================")
         logger.info(f"Total nodes to start: {total_nodes} (Quorum: {self.config.quorum_node_count}, Transaction: {total_nodes - self.config.quorum_node_count})")
         
         quorum_list = []
-        
-        for i in range(total_nodes):
-            node_id = f"node{i}"
-            server_port = self.config.base_server_port + i
-            grpc_port = self.config.base_grpc_port + i
-            is_quorum = i < self.config.quorum_node_count
-            
+        nodes_lock = threading.Lock()
+        node_specs = [(f"node{i}", i) for i in range(total_nodes)]
+
+        # Stage 1: spawn every node process up front; boots overlap instead of
+        # each node waiting for the previous one to come up
+        def _spawn(spec: Tuple[str, int]) -> bool:
+            node_id, index = spec
+            is_quorum = index < self.config.quorum_node_count
             node_type = "quorum" if is_quorum else "transaction"
-            logger.info(f"[{i+1}/{total_nodes}] Starting {node_id} ({node_type} node) on port {server_port}")
-            
-            # Start node process
-            if not self._start_node_process(node_id, i):
-                return False
-            
-            # Wait for node to be ready
-            client = RubixClient(f"http://localhost:{server_port}")
-            if not client.wait_for_node(self.config.node_startup_timeout):
-                return False
-            
-            # Create DID
+            logger.info(f"[{index+1}/{total_nodes}] Starting {node_id} ({node_type} node) on port {self.config.base_server_port + index}")
+            return self._spawn_node_process(node_id, index)
+
+        if not all(self.executor.map(_spawn, node_specs)):
+            return False
+
+        # Stage 2: wait for every node's HTTP API concurrently
+        def _await_ready(spec: Tuple[str, int]) -> bool:
+            _, index = spec
+            client = RubixClient(f"http://localhost:{self.config.base_server_port + index}", self.http)
+            return client.wait_for_node(self.config.node_startup_timeout)
+
+        if not all(self.executor.map(_await_ready, node_specs)):
+            return False
+
+        # Stage 3: create DIDs concurrently and record the resulting nodes
+        def _create_node_did(spec: Tuple[str, int]) -> bool:
+            node_id, index = spec
+            server_port = self.config.base_server_port + index
+            grpc_port = self.config.base_grpc_port + index
+            is_quorum = index < self.config.quorum_node_count
+
+            client = RubixClient(f"http://localhost:{server_port}", self.http)
             logger.info(f"  Creating DID for {node_id} with password...")
             try:
                 did, peer_id = client.create_did(self.config.default_priv_key_password)
             except Exception as e:
                 logger.error(f"Failed to create DID for {node_id}: {e}")
                 return False
-            
-            # Store node info
+
             node_info = NodeInfo(
-                node_id=node_id,
+                id=node_id,
                 server_port=server_port,
                 grpc_port=grpc_port,
                 did=did,
@@ -392,120 +596,143 @@ class RubixManager:
                 is_quorum=is_quorum,
                 status="running"
             )
-            
-            self.nodes[node_id] = node_info
-            
-            if is_quorum:
-                # Add to quorum list
-                quorum_list.append({
-                    "type": 2,
-                    "address": did
-                })
-                logger.info(f"  Added {node_id} to quorum list (total quorum members: {len(quorum_list)})")
-        
-        # Phase 2: DID Registration
-        logger.info("\n================== PHASE 2: DID Registration ==================")
-        logger.info(f"Registering all {len(self.nodes)} DIDs with the network...")
-        
-        registration_success = 0
-        for node_id, node_info in self.nodes.items():
-            node_type = "quorum" if node_info.is_quorum else "transaction"
-            logger.info(f"[{node_id}] Registering DID for {node_type} node...")
-            
-            client = RubixClient(f"http://localhost:{node_info.server_port}")
-            if client.register_did(node_info.did, self.config.default_priv_key_password):
-                registration_success += 1
-            else:
-                logger.warning(f"  ⚠ WARNING: Failed to register DID for {node_id}")
-        
-        logger.info(f"DID registration complete: {registration_success}/{len(self.nodes)} nodes registered")
-        
-        # Phase 3: Quorum List Distribution
-        logger.info("\n================== PHASE 3: Quorum List Distribution ==================")
-        logger.info(f"Distributing quorum list to all {len(self.nodes)} nodes...")
+            node_info.client = RubixClient(node_info.base_url, self.http)
+            node_info.process = self._processes.get(node_id)
+
+            with nodes_lock:
+                self.nodes[node_id] = node_info
+                if is_quorum:
+                    # Add to quorum list
+                    quorum_list.append({
+                        "type": 2,
+                        "address": did
+                    })
+                    logger.info(f"  Added {node_id} to quorum list (total quorum members: {len(quorum_list)})")
+
+            # Mark for the post-stage flush; saving here from every worker
+            # would re-serialize the whole dict N times
+            self._dirty = True
+            return True
+
+        did_results = list(self.executor.map(_create_node_did, node_specs))
+        # One save covers every node created above, even on partial failure,
+        # so a crash doesn't force a full re-setup of nodes that have DIDs
+        self._maybe_save()
+        if not all(did_results):
+            return False
         
-        quorum_add_success = 0
-        for node_id, node_info in self.nodes.items():
+        # Phases 2-4: per-node configuration pipeline
+        logger.info("\n================== PHASE 2-4: Node Configuration ==================")
+        logger.info(f"Configuring all {len(self.nodes)} nodes (register DID, add quorum, setup quorum)...")
+
+        # Serialize the quorum list once; every node receives identical bytes
+        quorum_body = orjson.dumps(quorum_list)
+
+        # The rubix node API has no bulk endpoint, but only same-node ordering
+        # matters between these calls. Running the whole register -> add-quorum
+        # -> setup-quorum chain per node (concurrently across nodes) replaces
+        # three sequential all-node barriers with one.
+        def _configure_node(node_info: NodeInfo) -> Tuple[bool, bool, bool]:
             node_type = "quorum" if node_info.is_quorum else "transaction"
-            logger.info(f"[{node_id}] Adding quorum list to {node_type} node...")
-            
-            client = RubixClient(f"http://localhost:{node_info.server_port}")
-            if client.add_quorum(quorum_list):
-                quorum_add_success += 1
-            else:
-                logger.error(f"  ✗ ERROR: Failed to add quorum to {node_id}")
-        
-        logger.info(f"Quorum configuration complete: {quorum_add_success}/{len(self.nodes)} nodes configured")
-        
-        # Phase 4: Quorum Setup
-        logger.info("\n================== PHASE 4: Quorum Setup ==================")
-        logger.info(f"Setting up {self.config.quorum_node_count} quorum nodes with quorum-specific configuration...")
-        
-        quorum_setup_success = 0
-        for node_id, node_info in self.nodes.items():
+            client = node_info.client
+
+            logger.info(f"[{node_info.id}] Registering DID for {node_type} node...")
+            registered = client.register_did(node_info.did, self.config.default_priv_key_password)
+            if not registered:
+                logger.warning(f"  ⚠ WARNING: Failed to register DID for {node_info.id}")
+
+            logger.info(f"[{node_info.id}] Adding quorum list to {node_type} node...")
+            quorum_added = client.add_quorum_raw(quorum_body)
+            if not quorum_added:
+                logger.error(f"  ✗ ERROR: Failed to add quorum to {node_info.id}")
+
+            quorum_setup = False
             if node_info.is_quorum:
-                client = RubixClient(f"http://localhost:{node_info.server_port}")
-                logger.info(f"[{node_id}] Setting up quorum configuration...")
-                
-                if client.setup_quorum(
+                logger.info(f"[{node_info.id}] Setting up quorum configuration...")
+                quorum_setup = client.setup_quorum(
                     node_info.did,
                     self.config.default_quorum_key_password,
                     self.config.default_priv_key_password
-                ):
-                    quorum_setup_success += 1
-                else:
-                    logger.warning(f"  ⚠ WARNING: Failed to setup quorum for {node_id}")
-        
+                )
+                if not quorum_setup:
+                    logger.warning(f"  ⚠ WARNING: Failed to setup quorum for {node_info.id}")
+
+            return registered, quorum_added, quorum_setup
+
+        config_results = list(self.executor.map(_configure_node, self.nodes.values()))
+        registration_success = sum(1 for registered, _, _ in config_results if registered)
+        quorum_add_success = sum(1 for _, quorum_added, _ in config_results if quorum_added)
+        quorum_setup_success = sum(1 for _, _, quorum_setup in config_results if quorum_setup)
+
+        logger.info(f"DID registration complete: {registration_success}/{len(self.nodes)} nodes registered")
+        logger.info(f"Quorum configuration complete: {quorum_add_success}/{len(self.nodes)} nodes configured")
         logger.info(f"Quorum setup complete: {quorum_setup_success}/{self.config.quorum_node_count} quorum nodes configured")
+
+        self._save_metadata()
         
         # Phase 5: Token Generation
         logger.info("\n================== PHASE 5: Token Generation ==================")
         logger.info(f"Generating 100 test RBT tokens for all {len(self.nodes)} nodes...")
         
-        token_gen_success = 0
-        for node_id, node_info in self.nodes.items():
+        def _submit_tokens_for_node(node_info: NodeInfo) -> bool:
+            node_id = node_info.id
             node_type = "quorum" if node_info.is_quorum else "transaction"
-            did_display = node_info.did[:16] + "..." if len(node_info.did) > 16 else node_info.did
-            logger.info(f"[{node_id}] Generating test tokens for {node_type} node (DID: {did_display})...")
-            
-            client = RubixClient(f"http://localhost:{node_info.server_port}")
-            
-            # Try token generation with retries
+            logger.info(f"[{node_id}] Generating test tokens for {node_type} node (DID: {node_info.did_display})...")
+
+            client = node_info.client
+
+            # Try token generation with retries (submission only; balance is
+            # verified by the shared waiter below)
             max_retries = 2
-            token_generated = False
-            
             for attempt in range(1, max_retries + 1):
                 if attempt > 1:
                     logger.info(f"  Retry {attempt}/{max_retries} for {node_id}...")
-                
-                if client.generate_test_tokens(node_info.did, 100, self.config.default_priv_key_password):
-                    # Verify tokens were generated
-                    logger.info(f"  Checking balance for {node_id}...")
-                    try:
-                        balance = client.get_account_balance(node_info.did)
-                        logger.info(f"  Balance for {node_id}: {balance:.3f} RBT")
-                        
-                        if balance > 0:
-                            logger.info(f"  ✓ Successfully generated tokens for {node_id} (Balance: {balance:.3f} RBT)")
-                            token_generated = True
-                            token_gen_success += 1
-                            break
-                        elif attempt < max_retries:
-                            logger.warning(f"  ⚠ Balance is 0, retrying token generation...")
-                            time.sleep(5)
-                        else:
-                            logger.error(f"  ✗ ERROR: {node_id} still has 0 balance after {max_retries} attempts!")
-                    except Exception as e:
-                        logger.error(f"  ✗ Failed to check balance: {e}")
-                        break
-                else:
-                    logger.error(f"  ✗ Failed to generate tokens (attempt {attempt})")
-                    if attempt == max_retries:
-                        break
-            
-            if not token_generated:
-                logger.error(f"  ✗ FAILED: Token generation failed for {node_id}")
-        
+
+                submitted, _ = client.generate_test_tokens(node_info.did, 100,
+                                                           self.config.default_priv_key_password,
+                                                           verify=False)
+                if submitted:
+                    return True
+                logger.error(f"  ✗ Failed to generate tokens (attempt {attempt})")
+
+            logger.error(f"  ✗ FAILED: Token generation failed for {node_id}")
+            return False
+
+        submit_results = list(self.executor.map(_submit_tokens_for_node, self.nodes.values()))
+
+        # One shared waiter polls every pending DID per tick instead of each
+        # node sitting through its own 5s-per-check verification loop
+        pending = {
+            node_info.id: node_info
+            for node_info, submitted in zip(self.nodes.values(), submit_results)
+            if submitted
+        }
+        funded: Dict[str, float] = {}
+
+        def _check_balance(node_info: NodeInfo) -> Tuple[str, float]:
+            client = node_info.client
+            try:
+                return node_info.id, client.get_account_balance(node_info.did)
+            except Exception as e:
+                logger.warning(f"  Balance check failed for {node_info.id}: {e}")
+                return node_info.id, 0.0
+
+        def _poll_pending_balances() -> bool:
+            for node_id, balance in self.executor.map(_check_balance, list(pending.values())):
+                if balance > 0:
+                    logger.info(f"  ✓ Successfully generated tokens for {node_id} (Balance: {balance:.3f} RBT)")
+                    funded[node_id] = balance
+                    del pending[node_id]
+            return not pending
+
+        if pending:
+            wait_until(_poll_pending_balances, timeout=self.config.node_startup_timeout)
+
+        for node_id in pending:
+            logger.error(f"  ✗ ERROR: {node_id} still has 0 balance after token generation")
+
+        token_gen_success = len(funded)
+
         logger.info(f"Token generation complete: {token_gen_success}/{len(self.nodes)} nodes have tokens")
         
         # Phase 6: Finalization
@@ -533,57 +760,34 @@ class RubixManager:
         
         return True
 
-    def _start_node_process(self, node_id: str, index: int) -> bool:
-        """Start a single node process"""
+    def _spawn_node_process(self, node_id: str, index: int) -> bool:
+        """Spawn a single node process without waiting for it to become ready"""
         
         # Calculate ports
         port = self.config.base_server_port + index
         grpc_port = self.config.base_grpc_port + index
         
-        # Create node directory
-        node_dir = self.data_dir / "nodes" / node_id
+        # Create node directory (absolute, so the subprocess cwd is stable)
+        node_dir = self._abs_nodes_dir / node_id
         node_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Get absolute paths and OS-specific build directory (matching Go implementation)
-        abs_data_dir = os.path.abspath(str(self.data_dir))
-        abs_rubix_path = os.path.join(abs_data_dir, "rubixgoplatform")
-        build_dir_name = self._get_build_dir()
-        
-        # Platform-specific binary names
-        if platform.system() == "Windows":
-            rubix_bin = "rubixgoplatform.exe"
-            ipfs_bin = "ipfs.exe"
-        else:
-            rubix_bin = "rubixgoplatform"
-            ipfs_bin = "ipfs"
-        
-        # Source paths in OS-specific build directory (matching Go)
-        src_rubix = os.path.join(abs_rubix_path, build_dir_name, rubix_bin)
-        src_ipfs = os.path.join(abs_rubix_path, build_dir_name, ipfs_bin)
-        src_swarm_key = os.path.join(abs_rubix_path, build_dir_name, "testswarm.key")
-        
-        # Destination paths (convert node_dir to string for os.path.join)
-        node_dir_str = str(node_dir)
-        dest_rubix = os.path.join(node_dir_str, rubix_bin)
-        dest_ipfs = os.path.join(node_dir_str, ipfs_bin)
-        dest_swarm_key = os.path.join(node_dir_str, "testswarm.key")
-        
-        # Copy files if they don't exist (matching Go logic)
-        if not os.path.exists(dest_rubix):
-            logger.info(f"Copying rubixgoplatform to {node_dir}")
-            shutil.copy2(src_rubix, dest_rubix)
-            if platform.system() != "Windows":
-                os.chmod(dest_rubix, 0o755)
-        
-        if not os.path.exists(dest_ipfs):
-            logger.info(f"Copying IPFS binary to {node_dir}")
-            shutil.copy2(src_ipfs, dest_ipfs)
-            if platform.system() != "Windows":
-                os.chmod(dest_ipfs, 0o755)
-        
-        if not os.path.exists(dest_swarm_key):
-            logger.info(f"Copying testswarm.key to {node_dir}")
-            shutil.copy2(src_swarm_key, dest_swarm_key)
+
+        dest_rubix = node_dir / RUBIX_BIN
+
+        # Install files if they don't exist (matching Go logic); one scandir
+        # replaces a stat call per expected file
+        existing = {entry.name for entry in os.scandir(node_dir)}
+
+        if RUBIX_BIN not in existing:
+            logger.info(f"Installing rubixgoplatform to {node_dir}")
+            _install_file(self._src_rubix, dest_rubix, executable=True)
+
+        if IPFS_BIN not in existing:
+            logger.info(f"Installing IPFS binary to {node_dir}")
+            _install_file(self._src_ipfs, node_dir / IPFS_BIN, executable=True)
+
+        if "testswarm.key" not in existing:
+            logger.info(f"Installing testswarm.key to {node_dir}")
+            _install_file(self._src_swarm_key, node_dir / "testswarm.key")
         
         # Build command arguments
         args = [
@@ -596,53 +800,11 @@ class RubixManager:
             "-grpcPort", str(grpc_port)
         ]
         
-        # Create platform-specific command
-        if platform.system() == "Windows":
-            # Create batch file
-            window_title = f"Rubix Node {node_id} - Port {port}"
-            
-            batch_content = f"""@echo off
-title {window_title}
-echo Starting {node_id} on port {port}...
-echo Node directory: {node_dir}
-echo.
-cd /d "{node_dir}"
-if not exist "{rubix_bin}" (
-    echo ERROR: {rubix_bin} not found in node directory
-    echo Please ensure all files are copied correctly.
-    pause > nul
-    exit /b 1
-)
-if not exist "{ipfs_bin}" (
-    echo ERROR: {ipfs_bin} not found in node directory
-    echo Please ensure IPFS is copied correctly.
-    pause > nul
-    exit /b 1
-)
-if not exist "testswarm.key" (
-    echo ERROR: testswarm.key not found in node directory
-    echo Please ensure swarm key is copied correctly.
-    pause > nul
-    exit /b 1
-)
-"{rubix_bin}" {' '.join(args)}
-echo.
-echo Node stopped. Press any key to close this window...
-pause > nul"""
-            
-            # Write batch file
-            batch_path = self.data_dir / f"node_{node_id}.bat"
-            batch_path.write_text(batch_content)
-            
-            # Start batch file in new window
-            cmd = ["cmd", "/c", "start", "", str(batch_path)]
-            
-        else:
-            # Linux/Mac: use tmux session
-            session_name = f"rubix-node-{node_id}"
-            node_command = f"cd {node_dir} && ./{rubix_bin} {' '.join(args)}"
-            cmd = ["tmux", "new-session", "-d", "-s", session_name, node_command]
-        
+        # Launch the binary directly: the manager keeps the real child PID for
+        # readiness checks and clean shutdown instead of losing it behind a
+        # tmux session or cmd-start window
+        cmd = [str(dest_rubix)] + args
+
         # Environment variables
         env = os.environ.copy()
         env.update({
@@ -652,56 +814,46 @@ pause > nul"""
         
         # Log command details
         logger.info(f"Starting node {node_id} from directory: {node_dir}")
-        logger.info(f"Command: {rubix_bin} {' '.join(args)}")
+        logger.info(f"Command: {RUBIX_BIN} {' '.join(args)}")
         
-        # Start process
+        # Start process with output captured to a per-node log file
         try:
-            process = subprocess.Popen(cmd, env=env)
-            logger.info(f"Node {node_id} process started successfully")
-            
-            # Store process reference if we have node info
+            stdout_log = open(node_dir / "stdout.log", "ab")
+            process = subprocess.Popen(
+                cmd,
+                cwd=node_dir,
+                env=env,
+                stdout=stdout_log,
+                stderr=subprocess.STDOUT,
+                start_new_session=not IS_WINDOWS
+            )
+            logger.info(f"Node {node_id} process started successfully (pid {process.pid})")
+
+            # Keep the handle so the node can be attached to its NodeInfo
+            # later and terminated cleanly on shutdown
+            self._processes[node_id] = process
             if node_id in self.nodes:
                 self.nodes[node_id].process = process
-            
-            # Give node time to boot
-            time.sleep(30)
+
+            # No boot sleep here: the caller's wait_for_node polls until the
+            # HTTP API answers, which already covers early connection refusals
             return True
-            
+
         except Exception as e:
             logger.error(f"Failed to start node process: {e}")
             return False
 
-    def _get_build_dir(self) -> str:
-        """Get build directory based on OS (matching Go implementation)"""
-        system = platform.system().lower()
-        if system == "windows":
-            return "windows"
-        elif system == "linux":
-            return "linux"
-        elif system == "darwin":
-            return "mac"
-        else:
-            return "build"
-
     def _setup_rubix_platform(self) -> bool:
         """Setup rubixgoplatform if needed"""
         logger.info("Setting up Rubix platform...")
         
         # For simplicity, assume platform is already built
         # In production, you would implement platform download/build logic here
-        build_dir_name = self._get_build_dir()
-        build_dir = self.rubix_path / build_dir_name
-        
-        if platform.system() == "Windows":
-            rubix_bin = "rubixgoplatform.exe"
-            ipfs_bin = "ipfs.exe"
-        else:
-            rubix_bin = "rubixgoplatform"
-            ipfs_bin = "ipfs"
-        
+        build_dir = self.rubix_path / BUILD_DIR_NAME
+
         required_files = [
-            build_dir / rubix_bin,
-            build_dir / ipfs_bin,
+            build_dir / RUBIX_BIN,
+            build_dir / IPFS_BIN,
             build_dir / "testswarm.key"
         ]
         
@@ -718,74 +870,138 @@ pause > nul"""
     def _adjust_node_count(self, requested_transaction_nodes: int) -> bool:
         """Adjust active node count from existing metadata"""
         
-        metadata = self._load_metadata()
-        if not metadata:
+        persisted = self._load_nodes()
+        if not persisted:
             logger.error("Failed to load metadata")
             return False
-        
+
         logger.info(f"Adjusting active nodes: selecting {requested_transaction_nodes} transaction nodes from a total of 20")
-        
+
         # Reset current nodes
         self.nodes = {}
-        
+
         # Always include quorum nodes
-        for node_id, node_data in metadata.items():
-            node_info = NodeInfo.from_dict(node_data)
+        quorum_nodes_added = 0
+        for node_id, node_info in persisted.items():
             if node_info.is_quorum:
+                node_info.client = RubixClient(node_info.base_url, self.http)
                 self.nodes[node_id] = node_info
-        
+                quorum_nodes_added += 1
+
         # Select first N transaction nodes
         transaction_nodes_added = 0
         for i in range(self.config.max_transaction_nodes):
             node_id = f"node{self.config.quorum_node_count + i}"
-            if node_id in metadata and transaction_nodes_added < requested_transaction_nodes:
-                node_data = metadata[node_id]
-                node_info = NodeInfo.from_dict(node_data)
+            if node_id in persisted and transaction_nodes_added < requested_transaction_nodes:
+                node_info = persisted[node_id]
                 if not node_info.is_quorum:
+                    node_info.client = RubixClient(node_info.base_url, self.http)
                     self.nodes[node_id] = node_info
                     transaction_nodes_added += 1
         
-        logger.info(f"Selected {self.config.quorum_node_count} quorum nodes and {transaction_nodes_added} transaction nodes")
+        logger.info("Selected %d quorum nodes and %d transaction nodes",
+                    quorum_nodes_added, transaction_nodes_added)
         return True
 
+    def _maybe_save(self) -> bool:
+        """Save metadata only if a worker flagged changes since the last save"""
+        if not self._dirty:
+            return True
+        self._dirty = False
+        return self._save_metadata()
+
     def _save_metadata(self) -> bool:
-        """Save node metadata to file"""
+        """Save node metadata to file atomically (temp file + rename).
+
+        Called incrementally as nodes come up so a crash mid-run loses at
+        most the node currently being set up, not the whole run. A reader
+        never sees a partially written file.
+        """
         try:
-            metadata = {node_id: node_info.to_dict() for node_id, node_info in self.nodes.items()}
-            with open(self.metadata_file, 'w') as f:
-                json.dump(metadata, f, indent=2)
+            with self._metadata_lock:
+                # NodeInfo is a slotted dataclass: orjson serializes its
+                # declared fields directly, no per-node dict conversion.
+                # Compact by default; set RUBIX_DEBUG_PRETTY to get the old
+                # indented form for eyeballing the file.
+                opts = orjson.OPT_INDENT_2 if os.environ.get("RUBIX_DEBUG_PRETTY") else 0
+                payload = orjson.dumps(self.nodes, option=opts)
+                tmp_file = self.metadata_file.with_suffix(".json.tmp")
+                fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                try:
+                    os.write(fd, payload)
+                    if self.config.metadata_fsync:
+                        os.fsync(fd)
+                finally:
+                    os.close(fd)
+                os.replace(tmp_file, self.metadata_file)
+                self._meta_cache = None
             return True
-        except Exception as e:
+        except (orjson.JSONEncodeError, OSError) as e:
             logger.error(f"Failed to save metadata: {e}")
             return False
 
+    def _load_nodes(self) -> Optional[Dict[str, NodeInfo]]:
+        """Load metadata and rebuild NodeInfo objects in a single pass"""
+        raw = self._load_metadata()
+        if not raw:
+            return None
+        return {node_id: NodeInfo._from_persisted(data) for node_id, data in raw.items()}
+
     def _load_metadata(self) -> Optional[Dict]:
-        """Load node metadata from file"""
+        """Load node metadata from file, memoized on (mtime_ns, size)"""
         try:
-            with open(self.metadata_file, 'r') as f:
-                return json.load(f)
-        except Exception as e:
+            st = self.metadata_file.stat()
+            key = (st.st_mtime_ns, st.st_size)
+            if self._meta_cache is not None and self._meta_cache[0] == key:
+                return self._meta_cache[1]
+            metadata = orjson.loads(self.metadata_file.read_bytes())
+            self._meta_cache = (key, metadata)
+            return metadata
+        except (orjson.JSONDecodeError, OSError) as e:
             logger.error(f"Failed to load metadata: {e}")
             return None
 
     def _cleanup(self):
         """Clean up existing node data"""
-        if self.metadata_file.exists():
-            self.metadata_file.unlink()
-        
-        nodes_dir = self.data_dir / "nodes"
-        if nodes_dir.exists():
-            shutil.rmtree(nodes_dir)
+        self._meta_cache = None
+        self.metadata_file.unlink(missing_ok=True)
+
+        # Each node directory holds its own chain data; removing them is
+        # IO-bound and independent, so fan the rmtrees out across threads
+        try:
+            # scandir yields entries with the stat from the directory read,
+            # so the is_dir split costs no extra syscalls or Path objects
+            with os.scandir(self._nodes_dir) as it:
+                subdirs = [entry.path for entry in it
+                           if entry.is_dir(follow_symlinks=False)]
+        except FileNotFoundError:
+            return
+        with ThreadPoolExecutor(max_workers=min(16, (os.cpu_count() or 1) * 4)) as pool:
+            for _ in pool.map(lambda p: shutil.rmtree(p, ignore_errors=True), subdirs):
+                pass
+        shutil.rmtree(self._nodes_dir, ignore_errors=True)
+
+def _nodes_arg(value: str) -> int:
+    """argparse type for --nodes: enforce the 2-20 bound at parse time
+    so bad invocations fail before any manager setup runs"""
+    count = int(value)
+    if not 2 <= count <= 20:
+        raise argparse.ArgumentTypeError("must be between 2 and 20")
+    return count
 
 def main():
     """Main entry point"""
     parser = argparse.ArgumentParser(description="Rubix Node Manager - Python Implementation")
-    parser.add_argument("--nodes", type=int, default=5, help="Number of transaction nodes to start (2-20)")
+    parser.add_argument("--nodes", type=_nodes_arg, default=5, help="Number of transaction nodes to start (2-20)")
     parser.add_argument("--fresh", action="store_true", help="Fresh start - clean existing data")
     parser.add_argument("--restart", action="store_true", help="Restart using existing metadata")
     
+    # Parse first: --help and bad arguments exit before any logging or
+    # manager setup runs
     args = parser.parse_args()
-    
+
+    _setup_logging()
+
     # Create configuration
     config = RubixConfig()
     
@@ -797,7 +1013,7 @@ def main():
             logger.info("Restarting nodes using existing metadata...")
             success = manager.start_nodes(2, fresh=False)  # Default to 2 for restart
         else:
-            logger.info(f"Starting {args.nodes} transaction nodes (fresh={args.fresh})...")
+            logger.info("Starting %d transaction nodes (fresh=%s)...", args.nodes, args.fresh)
             success = manager.start_nodes(args.nodes, fresh=args.fresh)
         
         if success:
@@ -807,7 +1023,7 @@ def main():
             sys.exit(1)
             
     except Exception as e:
-        logger.error(f"Error: {e}")
+        logger.error("Error: %s", e)
         sys.exit(1)
 
 if __name__ == "__main__":